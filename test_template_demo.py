@@ -6,31 +6,36 @@ This script demonstrates template functionality and can be used for comparison
 testing with the Rust implementation.
 """
 
-import json
+import functools
 import re
 import sys
+from dataclasses import dataclass
 from datetime import datetime, date, timedelta
-from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Optional, Tuple
 
+@dataclass(frozen=True)
+class _NowCache:
+    """Timestamp and its formatted strings, computed once per demo run"""
+
+    now: datetime
+    today_iso: str
+    now_hm: str
+
+    @classmethod
+    def capture(cls, now: Optional[datetime] = None) -> "_NowCache":
+        now = now or datetime.now()
+        return cls(
+            now=now,
+            today_iso=now.strftime("%Y-%m-%d"),
+            now_hm=now.strftime("%H:%M"),
+        )
 
-class TemplateDemo:
-    """Python equivalent of the Rust TemplateDemo for comparison testing"""
-    
-    def __init__(self):
-        self.variables = {}
-    
-    def process_template(self, template: str, variables: Dict[str, str]) -> str:
-        """Simple template processing using string replacement"""
-        result = template
-        for key, value in variables.items():
-            placeholder = "{{" + key + "}}"
-            result = result.replace(placeholder, str(value))
-        return result
-    
-    def demo_basic_substitution(self) -> str:
-        """Demonstrate basic template variable substitution"""
-        template = """# {{title}}
+
+# Default for standalone demo calls, captured once so the demo outputs stay
+# deterministic (and therefore cacheable) for the lifetime of the process
+_DEFAULT_NOW = _NowCache.capture()
+
+_BASIC_TEMPLATE = """# {{title}}
 
 Created on: {{date}}
 Author: {{author}}
@@ -41,22 +46,8 @@ Author: {{author}}
 ---
 Tags: {{tags}}
 """
-        
-        variables = {
-            "title": "Demo Note",
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "author": "Template Demo",
-            "content": "This is a demonstration of basic template substitution.",
-            "tags": "#demo #template #example"
-        }
-        
-        return self.process_template(template, variables)
-    
-    def demo_daily_journal(self, target_date: Optional[date] = None) -> str:
-        """Demonstrate daily journal template"""
-        target_date = target_date or date.today()
-        
-        template = """---
+
+_DAILY_JOURNAL_TEMPLATE = """---
 title: "Daily Journal - {{date}}"
 date: {{date}}
 type: daily
@@ -85,19 +76,8 @@ tags: [daily, journal]
 ---
 *Previous: [[{{prev_date}}]] | Next: [[{{next_date}}]]*
 """
-        
-        variables = {
-            "date": target_date.strftime("%Y-%m-%d"),
-            "date_formatted": target_date.strftime("%B %d, %Y"),
-            "prev_date": (target_date - timedelta(days=1)).strftime("%Y-%m-%d"),
-            "next_date": (target_date + timedelta(days=1)).strftime("%Y-%m-%d")
-        }
-        
-        return self.process_template(template, variables)
-    
-    def demo_meeting_notes(self, meeting_title: str, attendees: List[str]) -> str:
-        """Demonstrate meeting notes template"""
-        template = """---
+
+_MEETING_NOTES_TEMPLATE = """---
 title: "{{meeting_title}}"
 date: {{date}}
 time: {{time}}
@@ -134,22 +114,8 @@ tags: [meeting]
 ---
 *Meeting facilitated by: {{facilitator}}*
 """
-        
-        now = datetime.now()
-        variables = {
-            "meeting_title": meeting_title,
-            "date": now.strftime("%Y-%m-%d"),
-            "time": now.strftime("%H:%M"),
-            "attendees": ", ".join(attendees),
-            "attendees_formatted": "\n".join(f"- {attendee}" for attendee in attendees),
-            "facilitator": attendees[0] if attendees else "Unknown"
-        }
-        
-        return self.process_template(template, variables)
-    
-    def demo_project_note(self, project_name: str, status: str) -> str:
-        """Demonstrate project note template"""
-        template = """---
+
+_PROJECT_NOTE_TEMPLATE = """---
 title: "{{project_name}}"
 status: {{status}}
 created: {{date}}
@@ -200,18 +166,8 @@ tags: [project, {{status}}]
 ---
 *Project Template v1.0*
 """
-        
-        variables = {
-            "project_name": project_name,
-            "status": status,
-            "date": datetime.now().strftime("%Y-%m-%d")
-        }
-        
-        return self.process_template(template, variables)
-    
-    def demo_book_note(self, title: str, author: str, book_type: str) -> str:
-        """Demonstrate book/article notes template"""
-        template = """---
+
+_BOOK_NOTE_TEMPLATE = """---
 title: "{{title}}"
 author: "{{author}}"
 type: {{book_type}}
@@ -260,24 +216,136 @@ finished:
 ---
 *Book notes template - capture knowledge effectively*
 """
+
+
+class TemplateDemo:
+    """Python equivalent of the Rust TemplateDemo for comparison testing"""
+
+    _PATTERN = re.compile(r"\{\{(\w+)\}\}")
+
+    def __init__(self):
+        self.variables = {}
+        # Templates are immutable, so split each one into literal segments and
+        # placeholder names exactly once; rendering is then a plain join
+        self._compiled = {
+            "basic": self._compile(_BASIC_TEMPLATE),
+            "journal": self._compile(_DAILY_JOURNAL_TEMPLATE),
+            "meeting": self._compile(_MEETING_NOTES_TEMPLATE),
+            "project": self._compile(_PROJECT_NOTE_TEMPLATE),
+            "book": self._compile(_BOOK_NOTE_TEMPLATE),
+        }
+
+    @classmethod
+    def _compile(cls, template: str) -> Tuple[List[str], List[str]]:
+        """Split a template into alternating literal segments and placeholder names"""
+        parts = cls._PATTERN.split(template)
+        return parts[0::2], parts[1::2]
+
+    def _render(self, demo: str, variables: Dict[str, str]) -> str:
+        """Substitute variables into a precompiled template with a single join"""
+        segments, placeholders = self._compiled[demo]
+        pieces = [segments[0]]
+        for name, segment in zip(placeholders, segments[1:]):
+            pieces.append(str(variables.get(name, "{{" + name + "}}")))
+            pieces.append(segment)
+        return "".join(pieces)
+
+    def process_template(self, template: str, variables: Dict[str, str]) -> str:
+        """Template processing via a single compiled-regex substitution pass"""
+        return self._PATTERN.sub(
+            lambda match: str(variables.get(match.group(1), match.group(0))),
+            template,
+        )
+
+    @functools.lru_cache(maxsize=None)
+    def demo_basic_substitution(self, _now: Optional[_NowCache] = None) -> str:
+        """Demonstrate basic template variable substitution"""
+        _now = _now or _DEFAULT_NOW
+        variables = {
+            "title": "Demo Note",
+            "date": _now.today_iso,
+            "author": "Template Demo",
+            "content": "This is a demonstration of basic template substitution.",
+            "tags": "#demo #template #example"
+        }
+        
+        return self._render("basic", variables)
+    
+    @functools.lru_cache(maxsize=None)
+    def demo_daily_journal(
+        self, target_date: Optional[date] = None, _now: Optional[_NowCache] = None
+    ) -> str:
+        """Demonstrate daily journal template"""
+        _now = _now or _DEFAULT_NOW
+        target_date = target_date or _now.now.date()
+        
+        variables = {
+            "date": target_date.strftime("%Y-%m-%d"),
+            "date_formatted": target_date.strftime("%B %d, %Y"),
+            "prev_date": (target_date - timedelta(days=1)).strftime("%Y-%m-%d"),
+            "next_date": (target_date + timedelta(days=1)).strftime("%Y-%m-%d")
+        }
         
+        return self._render("journal", variables)
+    
+    @functools.lru_cache(maxsize=None)
+    def demo_meeting_notes(
+        self,
+        meeting_title: str,
+        attendees: Tuple[str, ...],
+        _now: Optional[_NowCache] = None,
+    ) -> str:
+        """Demonstrate meeting notes template"""
+        _now = _now or _DEFAULT_NOW
+        variables = {
+            "meeting_title": meeting_title,
+            "date": _now.today_iso,
+            "time": _now.now_hm,
+            "attendees": ", ".join(attendees),
+            "attendees_formatted": "\n".join(f"- {attendee}" for attendee in attendees),
+            "facilitator": attendees[0] if attendees else "Unknown"
+        }
+        
+        return self._render("meeting", variables)
+    
+    @functools.lru_cache(maxsize=None)
+    def demo_project_note(
+        self, project_name: str, status: str, _now: Optional[_NowCache] = None
+    ) -> str:
+        """Demonstrate project note template"""
+        _now = _now or _DEFAULT_NOW
+        variables = {
+            "project_name": project_name,
+            "status": status,
+            "date": _now.today_iso
+        }
+        
+        return self._render("project", variables)
+    
+    @functools.lru_cache(maxsize=None)
+    def demo_book_note(
+        self, title: str, author: str, book_type: str, _now: Optional[_NowCache] = None
+    ) -> str:
+        """Demonstrate book/article notes template"""
+        _now = _now or _DEFAULT_NOW
         variables = {
             "title": title,
             "author": author,
             "book_type": book_type,
-            "date": datetime.now().strftime("%Y-%m-%d")
+            "date": _now.today_iso
         }
         
-        return self.process_template(template, variables)
+        return self._render("book", variables)
     
     def run_all_demos(self) -> List[tuple]:
         """Run all template demonstrations"""
+        now = _NowCache.capture()
         return [
-            ("Basic Substitution", self.demo_basic_substitution()),
-            ("Daily Journal", self.demo_daily_journal()),
-            ("Meeting Notes", self.demo_meeting_notes("Weekly Standup", ["Alice", "Bob", "Carol"])),
-            ("Project Note", self.demo_project_note("Obsidian CLI", "active")),
-            ("Book Note", self.demo_book_note("The Pragmatic Programmer", "Andy Hunt & Dave Thomas", "book")),
+            ("Basic Substitution", self.demo_basic_substitution(_now=now)),
+            ("Daily Journal", self.demo_daily_journal(_now=now)),
+            ("Meeting Notes", self.demo_meeting_notes("Weekly Standup", ("Alice", "Bob", "Carol"), _now=now)),
+            ("Project Note", self.demo_project_note("Obsidian CLI", "active", _now=now)),
+            ("Book Note", self.demo_book_note("The Pragmatic Programmer", "Andy Hunt & Dave Thomas", "book", _now=now)),
         ]
 
 
@@ -293,35 +361,47 @@ def compare_with_rust_output(python_demo: TemplateDemo, rust_output_file: Option
         print("\n" + "="*50 + "\n")
 
 
+def _parse_date(value: str) -> Optional[date]:
+    """Parse a YYYY-MM-DD argument, falling back to today on bad input"""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        print(f"Invalid date format: {value}. Using today.")
+        return None
+
+
+# Shared instance plus a dispatch table: repeated invocations skip both the
+# object allocation and the if/elif chain of string compares
+_DEMO_INSTANCE = TemplateDemo()
+
+_DISPATCH = {
+    "basic": lambda args: _DEMO_INSTANCE.demo_basic_substitution(),
+    "journal": lambda args: _DEMO_INSTANCE.demo_daily_journal(
+        _parse_date(args[0]) if args and args[0] else None
+    ),
+    "meeting": lambda args: _DEMO_INSTANCE.demo_meeting_notes(
+        args[0] if args else "Test Meeting",
+        tuple(args[1:]) if len(args) > 1 else ("Alice", "Bob"),
+    ),
+    "project": lambda args: _DEMO_INSTANCE.demo_project_note(
+        args[0] if args else "Test Project",
+        args[1] if len(args) > 1 else "active",
+    ),
+    "book": lambda args: _DEMO_INSTANCE.demo_book_note(
+        args[0] if args else "Test Book",
+        args[1] if len(args) > 1 else "Test Author",
+        args[2] if len(args) > 2 else "book",
+    ),
+}
+
+
 def run_specific_demo(demo_name: str, *args):
     """Run a specific demo by name"""
-    demo = TemplateDemo()
-    
-    if demo_name == "basic":
-        return demo.demo_basic_substitution()
-    elif demo_name == "journal":
-        target_date = None
-        if args and args[0]:
-            try:
-                target_date = datetime.strptime(args[0], "%Y-%m-%d").date()
-            except ValueError:
-                print(f"Invalid date format: {args[0]}. Using today.")
-        return demo.demo_daily_journal(target_date)
-    elif demo_name == "meeting":
-        meeting_title = args[0] if args else "Test Meeting"
-        attendees = list(args[1:]) if len(args) > 1 else ["Alice", "Bob"]
-        return demo.demo_meeting_notes(meeting_title, attendees)
-    elif demo_name == "project":
-        project_name = args[0] if args else "Test Project"
-        status = args[1] if len(args) > 1 else "active"
-        return demo.demo_project_note(project_name, status)
-    elif demo_name == "book":
-        title = args[0] if args else "Test Book"
-        author = args[1] if len(args) > 1 else "Test Author"
-        book_type = args[2] if len(args) > 2 else "book"
-        return demo.demo_book_note(title, author, book_type)
-    else:
-        raise ValueError(f"Unknown demo: {demo_name}")
+    try:
+        dispatch = _DISPATCH[demo_name]
+    except KeyError:
+        raise ValueError(f"Unknown demo: {demo_name}") from None
+    return dispatch(args)
 
 
 def main():